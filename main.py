@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """Entry point for the Cauciones Price Checker."""
 
-from src.price_checker import run_price_check
+import asyncio
+import logging
+import os
+
+from src.price_checker import run_price_check_async
 
 if __name__ == "__main__":
-    success = run_price_check()
+    logging.basicConfig(level=os.environ.get("IOL_LOG", "WARNING"))
+    success = asyncio.run(run_price_check_async())
     exit(0 if success else 1)
@@ -1,66 +1,329 @@
 """InvertirOnline API client for fetching market data."""
 
-import requests
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+from itertools import product
+from pathlib import Path
+
+import httpx
 from typing import Optional, List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Fields where a caucion-ish instrument identifies itself; checking these
+# beats stringifying the whole item repr just to find a substring.
+_CAUCION_PROBE_KEYS = ("simbolo", "tipo", "descripcion", "instrumento")
+
+
+def _parse_json(response: "httpx.Response") -> Any:
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class IOLClient:
     """Client for interacting with InvertirOnline API."""
 
     BASE_URL = "https://api.invertironline.com"
-    TOKEN_URL = f"{BASE_URL}/token"
+
+    # Cached token survives across CLI invocations so scheduled runs
+    # skip the /token round trip entirely.
+    TOKEN_FILE = Path.home() / ".iol_token.json"
+
+    # Which endpoint (or symbols) serve caucion data is deterministic per
+    # account, so remember the first hit and skip discovery afterwards.
+    DISCOVERY_CACHE_FILE = Path.home() / ".iol_cache.json"
+
+    # Refresh this many seconds before the token actually expires.
+    TOKEN_EXPIRY_MARGIN = 30
+
+    # How long fetched cauciones stay fresh; short because rates are live
+    CACHE_TTL = 30.0
+
+    # Tight budget for "does this endpoint exist at all" probes, so one
+    # slow-failing candidate can't stall discovery for 30 s.
+    DISCOVERY_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+    # Caucion instruments have no official symbols in the API docs, so we
+    # probe the naming families seen in the wild, one symbol per plazo.
+    MERCADOS = ("bCBA",)
+    CAUCION_PLAZOS = (1, 7, 14, 30)
+    CAUCION_SYMBOL_FAMILIES = ("PESOS{days}", "{days}D", "CAUC{days}D")
 
     def __init__(self, username: str, password: str):
         self.username = username
         self.password = password
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        self.token_expiry: float = 0.0
 
-    def authenticate(self) -> bool:
-        """Authenticate with IOL API and obtain access token."""
-        payload = {
-            "username": self.username,
-            "password": self.password,
-            "grant_type": "password"
+        # One pooled HTTP/2 client: connections are kept alive across calls
+        # and concurrent requests multiplex over a single TLS connection
+        self.client = httpx.Client(
+            base_url=self.BASE_URL,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # An explicit transport overrides Client-level http2=/limits=,
+            # so the pool is sized on the transport itself
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            ),
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "CaucionesAdvisorIOL/1.0",
+            },
+        )
+
+        # Shared async client and loop live for the client lifetime, so
+        # probe batches reuse pooled connections instead of handshaking anew
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._cauciones_endpoint: Optional[str] = None
+        self._symbol_hits: List[tuple] = []
+        self._bulk_supported: Optional[bool] = None
+        self._preferred_family: Optional[str] = None
+
+        self._cauciones_cache: Optional[List[Dict[str, Any]]] = None
+        self._cauciones_cache_ts: float = 0.0
+        self._by_plazo: Dict[int, Dict[str, Any]] = {}
+
+        # The fallback sweep is deterministic, so build each family's URLs
+        # once per client instead of re-interpolating them per probe batch
+        self._family_urls: Dict[str, List[tuple]] = {
+            family: [
+                (f"/api/v2/{mercado}/Titulos/{symbol}/Cotizacion", symbol, days)
+                for mercado, (symbol, days) in product(self.MERCADOS, [
+                    (family.format(days=days), days)
+                    for days in self.CAUCION_PLAZOS
+                ])
+            ]
+            for family in self.CAUCION_SYMBOL_FAMILIES
         }
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+        self._load_cached_token()
+        self._load_discovery_cache()
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the shared AsyncClient, creating it on first use."""
+        if self._async_client is None or self._async_client.is_closed:
+            # Sized for the probe fan-out (<= 12 concurrent requests, one
+            # host): every gather task rides a pooled connection, and
+            # keepalive outlives the gaps between waves
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.BASE_URL,
+                timeout=httpx.Timeout(15.0),
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=60.0,
+                ),
+                headers=dict(self.client.headers),
+            )
+        return self._async_client
+
+    def _run_async(self, coro):
+        """Run a coroutine on the client's persistent event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Close the underlying HTTP clients."""
+        if self._async_client is not None:
+            self._run_async(self._async_client.aclose())
+            self._async_client = None
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+            self._loop = None
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def aclose(self):
+        """Close the async client from a running event loop."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _load_cached_token(self):
+        """Load a previously saved token from disk if it hasn't expired."""
+        try:
+            with open(self.TOKEN_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if cached.get("expires_at", 0) > time.time():
+            self.access_token = cached.get("access_token")
+            self.refresh_token = cached.get("refresh_token")
+            self.token_expiry = cached["expires_at"]
+            self.client.headers["Authorization"] = f"Bearer {self.access_token}"
+
+    def _save_cached_token(self):
+        """Persist the current token so future invocations skip /token."""
+        # Write-then-rename so a concurrent cron run never reads a
+        # half-written file
+        tmp_file = self.TOKEN_FILE.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({
+                    "access_token": self.access_token,
+                    "refresh_token": self.refresh_token,
+                    "expires_at": self.token_expiry,
+                }, f)
+            # The file holds account credentials - owner-only before it
+            # becomes visible under the real name
+            os.chmod(tmp_file, 0o600)
+            os.replace(tmp_file, self.TOKEN_FILE)
+        except OSError:
+            pass
+
+    def _token_expiry_from(self, data: dict) -> float:
+        """Compute the expiry timestamp for a /token response."""
+        expires_in = data.get("expires_in")
+        if expires_in:
+            return time.time() + float(expires_in) - self.TOKEN_EXPIRY_MARGIN
+
+        # Fall back to the exp claim in the JWT payload
+        try:
+            payload_b64 = self.access_token.split(".")[1]
+            payload_b64 += "=" * (-len(payload_b64) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+            return float(payload["exp"]) - self.TOKEN_EXPIRY_MARGIN
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            # AttributeError covers a missing access_token (None)
+            return 0.0
+
+    def _apply_token_response(self, data: dict):
+        """Store tokens from a /token response and update client headers."""
+        self.access_token = data.get("access_token")
+        self.refresh_token = data.get("refresh_token")
+        self.token_expiry = self._token_expiry_from(data)
+        self.client.headers["Authorization"] = f"Bearer {self.access_token}"
+        if self._async_client is not None:
+            self._async_client.headers["Authorization"] = f"Bearer {self.access_token}"
+        self._save_cached_token()
+
+    def _request_token(self, payload: dict) -> bool:
+        """POST to the token endpoint and apply the response."""
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
         try:
-            response = requests.post(self.TOKEN_URL, data=payload, headers=headers, timeout=30)
+            response = self.client.post("/token", data=payload, headers=headers)
 
             if response.status_code == 200:
-                data = response.json()
-                self.access_token = data.get("access_token")
-                self.refresh_token = data.get("refresh_token")
-                print("Authentication successful")
+                try:
+                    data = _parse_json(response)
+                except ValueError as e:
+                    log.error("Non-JSON body from /token: %s", e)
+                    return False
+                self._apply_token_response(data)
                 return True
 
-            print(f"Authentication failed: {response.status_code} - {response.text}")
+            log.error("Authentication failed: %s - %s", response.status_code, response.text)
             return False
-        except requests.exceptions.RequestException as e:
-            print(f"Authentication error: {e}")
+        except httpx.HTTPError as e:
+            log.error("Authentication error: %s", e)
             return False
 
-    def _get_headers(self) -> dict:
-        """Get headers with authorization token."""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+    def authenticate(self) -> bool:
+        """Authenticate with IOL API and obtain access token."""
+        if self._request_token({
+            "username": self.username,
+            "password": self.password,
+            "grant_type": "password"
+        }):
+            log.info("Authentication successful")
+            return True
+        return False
+
+    def _refresh_access_token(self) -> bool:
+        """Exchange the refresh token for a new access token."""
+        return self._request_token({
+            "refresh_token": self.refresh_token,
+            "grant_type": "refresh_token"
+        })
+
+    def _ensure_token(self) -> bool:
+        """Make sure a valid access token is available, refreshing if needed."""
+        if self.access_token and time.time() < self.token_expiry:
+            return True
+        if self.refresh_token and self._refresh_access_token():
+            return True
+        return self.authenticate()
+
+    def _load_discovery_cache(self):
+        """Load the previously discovered caucion endpoint and symbols."""
+        try:
+            with open(self.DISCOVERY_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self._cauciones_endpoint = cached.get("endpoint")
+        self._symbol_hits = [tuple(hit) for hit in cached.get("symbols", [])]
+        self._bulk_supported = cached.get("bulk")
+        self._preferred_family = cached.get("family")
+
+    def _save_discovery_cache(self):
+        """Persist discovery results so the next process skips probing."""
+        try:
+            with open(self.DISCOVERY_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump({
+                    "endpoint": self._cauciones_endpoint,
+                    "symbols": self._symbol_hits,
+                    "bulk": self._bulk_supported,
+                    "family": self._preferred_family,
+                }, f)
+        except OSError:
+            pass
+
+    def _invalidate_discovery_cache(self):
+        """Drop stale discovery results (endpoint gone or auth changed)."""
+        self._cauciones_endpoint = None
+        self._symbol_hits = []
+        self._bulk_supported = None
+        self._preferred_family = None
+        try:
+            self.DISCOVERY_CACHE_FILE.unlink()
+        except OSError:
+            pass
 
     def get_cotizacion(self, symbol: str, mercado: str = "bCBA") -> Optional[Dict[str, Any]]:
         """Get cotizacion for a specific symbol."""
-        if not self.access_token:
-            if not self.authenticate():
-                return None
+        if not self._ensure_token():
+            return None
 
-        url = f"{self.BASE_URL}/api/v2/{mercado}/Titulos/{symbol}/Cotizacion"
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
+            response = self.client.get(f"/api/v2/{mercado}/Titulos/{symbol}/Cotizacion")
             if response.status_code == 200:
-                return response.json()
+                return _parse_json(response)
             return None
-        except requests.exceptions.RequestException:
+        except (httpx.HTTPError, ValueError):
             return None
 
     def get_cauciones(self) -> List[Dict[str, Any]]:
@@ -71,79 +334,286 @@ class IOLClient:
         They are selected by currency (ARS/USD) + days in the web interface.
         The API might not expose caucion rates directly.
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return []
+        # Serve repeated calls within the TTL from memory, zero network
+        if (self._cauciones_cache is not None
+                and time.monotonic() - self._cauciones_cache_ts < self.CACHE_TTL):
+            return self._cauciones_cache
+
+        if not self._ensure_token():
+            return []
+
+        # One batch call beats N per-symbol probes regardless of transport;
+        # skip it only if a previous run learned this account lacks it.
+        if self._bulk_supported is not False:
+            caucion_items = self._fetch_cauciones_bulk()
+            if caucion_items:
+                if self._bulk_supported is not True:
+                    self._bulk_supported = True
+                    self._save_discovery_cache()
+                return self._cache_cauciones(caucion_items)
+            if self._bulk_supported is None:
+                self._bulk_supported = False
+                self._save_discovery_cache()
+
+        # Hit the remembered endpoint first; discovery is deterministic per
+        # account, so re-walking the candidates would waste (N-1) round trips.
+        if self._cauciones_endpoint:
+            caucion_items = self._fetch_caucion_endpoint(self._cauciones_endpoint)
+            if caucion_items:
+                return self._cache_cauciones(caucion_items)
+            self._invalidate_discovery_cache()
 
-        # Test API connectivity
-        print("Testing API with GGAL...")
-        ggal = self.get_cotizacion("GGAL", "bCBA")
-        if ggal:
-            print(f"API working. GGAL: ${ggal.get('ultimoPrecio', 'N/A')}")
-        else:
-            print("Warning: Could not fetch GGAL")
+        # When symbol probing won before, the discovery endpoints are known
+        # dead for this account - skip their preflights and probe directly.
+        if self._symbol_hits:
+            cauciones = self._run_async(self._get_cauciones_async())
+            if cauciones:
+                return self._cache_cauciones(cauciones)
+            self._invalidate_discovery_cache()
 
         # Try to find caucion endpoints
         # Based on API docs, tipo includes: cAUCIONESPESOS, cAUCIONESDOLARES
         endpoints = [
+            f"/api/v2/{self.MERCADOS[0]}/Titulos?tipo=cAUCIONESPESOS",
             "/api/v2/Cotizaciones/Cauciones",
             "/api/v2/Cauciones",
             "/api/v2/Operaciones",
         ]
 
-        print("\nSearching for caucion data...")
+        log.debug("Searching for caucion data...")
         for endpoint in endpoints:
-            url = f"{self.BASE_URL}{endpoint}"
+            caucion_items = self._fetch_caucion_endpoint(endpoint, preflight=True)
+            if caucion_items:
+                self._cauciones_endpoint = endpoint
+                self._save_discovery_cache()
+                return self._cache_cauciones(caucion_items)
+
+        # No endpoint exposes cauciones directly; fan out over the candidate
+        # symbols concurrently instead of probing them one by one.
+        log.debug("Endpoint discovery failed, probing caucion symbols...")
+        cauciones = self._run_async(self._get_cauciones_async())
+        if cauciones:
+            log.debug("Found %d cauciones via symbol probing", len(cauciones))
+            self._symbol_hits = [(c.get("simbolo"), c.get("plazo")) for c in cauciones]
+            self._save_discovery_cache()
+            return self._cache_cauciones(cauciones)
+
+        log.warning(
+            "Cauciones not available via API: no endpoint or symbol probe "
+            "returned data. Cauciones are selected by currency + days in the "
+            "web UI, not by traditional stock symbols. Consider contacting "
+            "IOL support about caucion API access."
+        )
+
+        return []
+
+    def _cache_cauciones(self, cauciones: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Memoize a fetched caucion list and index it by plazo."""
+        self._cauciones_cache = cauciones
+        self._cauciones_cache_ts = time.monotonic()
+        self._by_plazo = {
+            (c.get("plazo") or c.get("diasVencimiento")): c
+            for c in cauciones
+        }
+        return cauciones
+
+    def _fetch_cauciones_bulk(self) -> List[Dict[str, Any]]:
+        """Fetch all caucion cotizaciones in one batch POST."""
+        payload = {
+            "simbolos": [f"CAUC{days}D" for days in self.CAUCION_PLAZOS],
+            "mercado": self.MERCADOS[0],
+        }
+        try:
+            response = self.client.post(
+                "/api/v2/Cotizaciones/MultipleCotizaciones",
+                json=payload,
+                timeout=15,
+            )
+        except httpx.HTTPError:
+            return []
+
+        if response.status_code != 200:
+            return []
+
+        try:
+            data = _parse_json(response)
+        except ValueError:
+            return []
+        titulos = data.get("titulos") if isinstance(data, dict) else data
+        if isinstance(titulos, list):
+            return [titulo for titulo in titulos if isinstance(titulo, dict)]
+        return []
+
+    def _fetch_caucion_endpoint(self, endpoint: str, preflight: bool = False) -> List[Dict[str, Any]]:
+        """GET one candidate endpoint and extract caucion items from it."""
+        if preflight:
+            # HEAD answers "does this exist" without a body; 405 only means
+            # HEAD itself is unsupported, so the GET still proceeds.
             try:
-                response = requests.get(url, headers=self._get_headers(), timeout=15)
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"Found data at {endpoint}: {type(data).__name__}")
-                    
-                    if isinstance(data, list):
-                        print(f"  Items count: {len(data)}")
-                        # Print first few items to understand structure
-                        for i, item in enumerate(data[:5]):
-                            print(f"  [{i}]: {item}")
-                        
-                        # Look for caucion-related items
-                        caucion_items = [
-                            item for item in data 
-                            if isinstance(item, dict) and 
-                            ('caucion' in str(item).lower() or 'cauc' in str(item).lower())
-                        ]
-                        if caucion_items:
-                            print(f"\n  Found {len(caucion_items)} caucion-related items:")
-                            for item in caucion_items[:3]:
-                                print(f"    {item}")
-                            return caucion_items
-                    
-                    if isinstance(data, dict):
-                        print(f"  Keys: {list(data.keys())}")
-                        print(f"  Sample: {str(data)[:500]}")
-            except Exception as e:
-                print(f"  Error: {e}")
-                continue
-
-        print("\n" + "="*60)
-        print("CAUCIONES NOT AVAILABLE VIA API")
-        print("="*60)
-        print("The IOL API does not appear to expose caucion rates.")
-        print("Cauciones are selected by currency + days in the web UI,")
-        print("not by traditional stock symbols.")
-        print("")
-        print("Options:")
-        print("1. Contact IOL support to ask about caucion API access")
-        print("2. Use web scraping (requires different approach)")
-        print("3. Monitor stocks instead of cauciones")
-        print("="*60)
-        
+                head = self.client.head(endpoint, timeout=self.DISCOVERY_TIMEOUT)
+            except httpx.HTTPError as e:
+                log.debug("Preflight error on %s: %s", endpoint, e)
+                return []
+            if head.status_code not in (200, 405):
+                log.debug("Skipping %s (preflight %s)", endpoint, head.status_code)
+                return []
+
+        timeout = self.DISCOVERY_TIMEOUT if preflight else 15
+        try:
+            response = self.client.get(endpoint, timeout=timeout)
+        except Exception as e:
+            log.debug("Error fetching %s: %s", endpoint, e)
+            return []
+
+        if response.status_code != 200:
+            return []
+
+        try:
+            data = _parse_json(response)
+        except ValueError as e:
+            log.debug("Non-JSON body from %s: %s", endpoint, e)
+            return []
+        log.debug("Found data at %s: %s", endpoint, type(data).__name__)
+
+        if isinstance(data, list):
+            log.debug("  Items count: %d", len(data))
+            # Log first few items to understand structure
+            for i, item in enumerate(data[:5]):
+                log.debug("  [%d]: %r", i, item)
+
+            # Endpoints that already select cauciones need no client-side filter
+            if "cauc" in endpoint.lower():
+                caucion_items = [item for item in data if isinstance(item, dict)]
+            else:
+                # Look for caucion-related items
+                caucion_items = [
+                    item for item in data
+                    if isinstance(item, dict) and any(
+                        "cauc" in str(item.get(key, "")).lower()
+                        for key in _CAUCION_PROBE_KEYS
+                    )
+                ]
+            if caucion_items:
+                log.debug("  Found %d caucion-related items", len(caucion_items))
+                for item in caucion_items[:3]:
+                    log.debug("    %r", item)
+                return caucion_items
+
+        if isinstance(data, dict):
+            log.debug("  Keys: %s", list(data.keys()))
+            log.debug("  Sample: %.500s", data)
+
         return []
 
+    async def _probe_caucion_symbol(
+        self,
+        client: "httpx.AsyncClient",
+        semaphore: asyncio.Semaphore,
+        url: str,
+        symbol: str,
+        days: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one candidate caucion cotizacion, or None if it doesn't exist."""
+        async with semaphore:
+            try:
+                response = await client.get(url)
+                if response.status_code != 200:
+                    return None
+                data = _parse_json(response)
+            except (httpx.HTTPError, ValueError):
+                return None
+
+        if not isinstance(data, dict) or not data.get("ultimoPrecio"):
+            return None
+        data.setdefault("plazo", days)
+        data.setdefault("simbolo", symbol)
+        return data
+
+    async def _get_cauciones_async(self) -> List[Dict[str, Any]]:
+        """
+        Probe candidate caucion symbols concurrently, one family at a time.
+
+        Within a family the probes fan out via asyncio.gather (bounded by
+        a semaphore so we don't trip IOL rate limits). Across families we
+        short-circuit: only one naming family is valid per account, so
+        later families only fire for plazos the earlier ones missed, and
+        the winning family persists so steady-state runs probe 4 symbols
+        instead of 12.
+        """
+        semaphore = asyncio.Semaphore(10)
+        client = self._get_async_client()
+
+        # Opt-in GGAL connectivity check; when enabled it rides along in
+        # the first gather, so it costs no extra wall time.
+        healthcheck = bool(os.environ.get("IOL_HEALTHCHECK"))
+
+        async def _ping_ggal() -> None:
+            try:
+                response = await client.get("/api/v2/bCBA/Titulos/GGAL/Cotizacion")
+            except httpx.HTTPError as e:
+                log.warning("Could not fetch GGAL: %s", e)
+                return None
+            if response.status_code == 200:
+                ggal = _parse_json(response)
+                log.debug("API working. GGAL: $%s", ggal.get("ultimoPrecio", "N/A"))
+            else:
+                log.warning("Could not fetch GGAL (status %s)", response.status_code)
+            return None
+
+        # Previously discovered symbols make the family sweep redundant
+        if self._symbol_hits:
+            tasks = [
+                self._probe_caucion_symbol(
+                    client,
+                    semaphore,
+                    f"/api/v2/{self.MERCADOS[0]}/Titulos/{symbol}/Cotizacion",
+                    symbol,
+                    days,
+                )
+                for symbol, days in self._symbol_hits
+            ]
+            if healthcheck:
+                tasks.append(_ping_ggal())
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return [result for result in results if isinstance(result, dict)]
+
+        # Remembered family goes first so it usually satisfies every plazo
+        families = [f for f in self.CAUCION_SYMBOL_FAMILIES if f != self._preferred_family]
+        if self._preferred_family in self.CAUCION_SYMBOL_FAMILIES:
+            families.insert(0, self._preferred_family)
+
+        found: Dict[int, Dict[str, Any]] = {}
+        ping = _ping_ggal() if healthcheck else None
+        for family in families:
+            pending = [
+                (url, symbol, days)
+                for url, symbol, days in self._family_urls[family]
+                if days not in found
+            ]
+            if not pending:
+                break
+
+            tasks = [
+                self._probe_caucion_symbol(client, semaphore, url, symbol, days)
+                for url, symbol, days in pending
+            ]
+            if ping is not None:
+                tasks.append(ping)
+                ping = None
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            hits = [result for result in results if isinstance(result, dict)]
+            if hits and self._preferred_family != family:
+                self._preferred_family = family
+                self._save_discovery_cache()
+            for hit in hits:
+                found.setdefault(hit.get("plazo"), hit)
+
+        if ping is not None:
+            await ping
+        return list(found.values())
+
     def get_caucion_by_days(self, days: int) -> Optional[Dict[str, Any]]:
         """Get caucion data for a specific number of days."""
-        cauciones = self.get_cauciones()
-        for caucion in cauciones:
-            if caucion.get("plazo") == days:
-                return caucion
-        return None
+        self.get_cauciones()
+        return self._by_plazo.get(days)
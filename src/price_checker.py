@@ -1,12 +1,61 @@
 """Main price checking logic for cauciones alerts."""
 
+import asyncio
 import json
+import logging
+import operator
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from .iol_client import IOLClient
-from .telegram_notifier import TelegramNotifier
+from .telegram_notifier import AsyncTelegramNotifier, TelegramNotifier
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = logging.getLogger(__name__)
+
+# Condition strings resolve to C-level comparators once, instead of
+# walking an if/elif ladder on every alert evaluation
+_OPS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": lambda current, target: abs(current - target) < 0.01,
+}
+
+# The rate field per alert type, resolved once at import. Top-level
+# precioCompra/precioVenta are deliberately not consulted: the async
+# probe only inserts items that carry ultimoPrecio, and those fields
+# hold prices, not rates - falling back to them could fire bogus alerts.
+_RATE_FIELD = {"colocador": "tasaColocadora", "tomador": "tasaTomadora"}
+
+# Orderbook puntas quote caucion rates, so they remain a valid fallback
+_PUNTAS_FIELDS = {"colocador": "precioCompra", "tomador": "precioVenta"}
+
+# Condition codes for the vectorized path; below this many alerts the
+# scalar loop wins and NumPy (optional) isn't worth the array setup
+_OP_CODES = {">=": 0, "<=": 1, ">": 2, "<": 3, "==": 4}
+_VECTORIZE_THRESHOLD = 32
+
+
+@lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime: float) -> dict:
+    """Parse a config file; keyed on (path, mtime) so unchanged files skip the parse."""
+    data = Path(config_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_alerts_config(config_path: Optional[str] = None) -> dict:
@@ -15,127 +64,133 @@ def load_alerts_config(config_path: Optional[str] = None) -> dict:
         # Default to alerts_config.json in project root
         config_path = Path(__file__).parent.parent / "alerts_config.json"
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _parse_config(str(config_path), os.path.getmtime(config_path))
 
 
 def check_condition(current_value: float, target_value: float, condition: str) -> bool:
     """Check if the current value meets the condition against target."""
-    if condition == ">=":
-        return current_value >= target_value
-    elif condition == "<=":
-        return current_value <= target_value
-    elif condition == ">":
-        return current_value > target_value
-    elif condition == "<":
-        return current_value < target_value
-    elif condition == "==":
-        return abs(current_value - target_value) < 0.01
-    return False
+    op = _OPS.get(condition)
+    if op is None:
+        return False
+    return op(current_value, target_value)
 
 
 def get_rate_from_caucion(caucion_data: dict, rate_type: str) -> Optional[float]:
     """Extract the appropriate rate from caucion data."""
-    # Try different field names the API might use
-    if rate_type == "colocador":
-        return (
-            caucion_data.get("tasaColocadora") or 
-            caucion_data.get("precioCompra") or
-            caucion_data.get("puntas", {}).get("precioCompra")
-        )
-    elif rate_type == "tomador":
-        return (
-            caucion_data.get("tasaTomadora") or 
-            caucion_data.get("precioVenta") or
-            caucion_data.get("puntas", {}).get("precioVenta")
-        )
-    return None
+    field = _RATE_FIELD.get(rate_type)
+    if field is None:
+        return None
 
+    value = caucion_data.get(field)
+    if value:
+        return value
 
-def run_price_check():
-    """Main function to check prices and send alerts."""
-    # Load credentials from environment variables
-    iol_username = os.environ.get("IOL_USERNAME")
-    iol_password = os.environ.get("IOL_PASSWORD")
-    telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    telegram_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
+    puntas = caucion_data.get("puntas")
+    if puntas:
+        return puntas.get(_PUNTAS_FIELDS[rate_type])
+    return None
 
-    # Validate required environment variables
-    if not all([iol_username, iol_password, telegram_token, telegram_chat_id]):
-        print("Error: Missing required environment variables")
-        print("Required: IOL_USERNAME, IOL_PASSWORD, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID")
-        return False
 
-    # Initialize clients
-    iol_client = IOLClient(iol_username, iol_password)
-    notifier = TelegramNotifier(telegram_token, telegram_chat_id)
+def parse_alerts(alerts: list) -> list:
+    """Resolve enabled alerts into compact tuples once, before the check loop."""
+    parsed = []
 
-    # Load alerts configuration
-    try:
-        config = load_alerts_config()
-    except FileNotFoundError:
-        notifier.send_error_message("alerts_config.json not found")
-        return False
-    except json.JSONDecodeError as e:
-        notifier.send_error_message(f"Invalid JSON in config: {e}")
-        return False
+    for alert in alerts:
+        if not alert.get("enabled", True):
+            continue
 
-    alerts = config.get("alerts", [])
+        condition = alert.get("condition", ">=")
+        op = _OPS.get(condition)
+        if op is None:
+            log.warning("Skipping alert with unknown condition %r", condition)
+            continue
 
-    if not alerts:
-        print("No alerts configured")
-        return True
+        try:
+            days = alert["days"]
+            rate_type = alert["type"]
+            target_rate = float(alert["target_rate"])
+        except (KeyError, TypeError, ValueError):
+            log.warning("Skipping malformed alert: %r", alert)
+            continue
 
-    # Fetch cauciones data
-    cauciones = iol_client.get_cauciones()
+        parsed.append((days, rate_type, target_rate, condition, alert.get("description"), op))
 
-    if not cauciones:
-        notifier.send_error_message("Failed to fetch cauciones data from IOL API")
-        return False
+    return parsed
 
-    # Build a lookup by days (plazo) - handle different field names
-    cauciones_by_days = {}
-    for c in cauciones:
-        days_key = c.get("plazo") or c.get("diasVencimiento") or c.get("cantidadDias")
-        if days_key:
-            cauciones_by_days[days_key] = c
-            print(f"Found caucion: {days_key} days - {c}")
-    
-    if not cauciones_by_days:
-        print("Warning: Could not parse cauciones data. Raw data sample:")
-        print(cauciones[:2] if len(cauciones) > 2 else cauciones)
-
-    # Check each enabled alert
-    alerts_triggered = 0
 
-    for alert in alerts:
-        if not alert.get("enabled", True):
+def _check_alerts_vectorized(parsed_alerts: list, cauciones_by_days: dict,
+                             notifier: TelegramNotifier) -> int:
+    """Evaluate all alert conditions in one NumPy pass (SoA layout)."""
+    get_caucion = cauciones_by_days.get
+
+    current = np.full(len(parsed_alerts), np.nan)
+    for i, (days, rate_type, _target, _condition, _description, _op) in enumerate(parsed_alerts):
+        caucion_data = get_caucion(days)
+        if caucion_data is None:
+            log.info("No caucion data found for %s day(s)", days)
+            continue
+        rate = get_rate_from_caucion(caucion_data, rate_type)
+        if rate is None:
+            log.info("Could not get %s rate for %s day(s)", rate_type, days)
             continue
+        current[i] = rate
+
+    target = np.array([alert[2] for alert in parsed_alerts], dtype=np.float64)
+    op_codes = np.array([_OP_CODES[alert[3]] for alert in parsed_alerts], dtype=np.int8)
+
+    triggered = ~np.isnan(current) & (
+        ((op_codes == 0) & (current >= target))
+        | ((op_codes == 1) & (current <= target))
+        | ((op_codes == 2) & (current > target))
+        | ((op_codes == 3) & (current < target))
+        | ((op_codes == 4) & (np.abs(current - target) < 0.01))
+    )
+
+    for i in np.nonzero(triggered)[0]:
+        days, rate_type, target_rate, condition, description, _op = parsed_alerts[i]
+        log.info("Alert triggered: %sd %s %.2f%% %s %.2f%%",
+                 days, rate_type, current[i], condition, target_rate)
+        notifier.queue_alert(
+            days=days,
+            alert_type=rate_type,
+            current_rate=float(current[i]),
+            target_rate=target_rate,
+            condition=condition,
+            description=description
+        )
+
+    return int(triggered.sum())
 
-        days = alert.get("days")
-        rate_type = alert.get("type")
-        target_rate = alert.get("target_rate")
-        condition = alert.get("condition", ">=")
-        description = alert.get("description")
 
+def check_alerts(parsed_alerts: list, cauciones_by_days: dict, notifier: TelegramNotifier) -> int:
+    """Evaluate parsed alerts against already-fetched cauciones; returns count triggered."""
+    # Large configs evaluate every comparison in a single C loop
+    if np is not None and len(parsed_alerts) >= _VECTORIZE_THRESHOLD:
+        return _check_alerts_vectorized(parsed_alerts, cauciones_by_days, notifier)
+
+    alerts_triggered = 0
+    get_caucion = cauciones_by_days.get
+
+    for days, rate_type, target_rate, condition, description, op in parsed_alerts:
         # Get caucion data for the specified days
-        caucion_data = cauciones_by_days.get(days)
+        caucion_data = get_caucion(days)
 
         if caucion_data is None:
-            print(f"No caucion data found for {days} day(s)")
+            log.info("No caucion data found for %s day(s)", days)
             continue
 
         # Get the current rate
         current_rate = get_rate_from_caucion(caucion_data, rate_type)
 
         if current_rate is None:
-            print(f"Could not get {rate_type} rate for {days} day(s)")
+            log.info("Could not get %s rate for %s day(s)", rate_type, days)
             continue
 
         # Check if condition is met
-        if check_condition(current_rate, target_rate, condition):
-            print(f"Alert triggered: {days}d {rate_type} {current_rate:.2f}% {condition} {target_rate:.2f}%")
-            notifier.send_price_alert(
+        if op(current_rate, target_rate):
+            log.info("Alert triggered: %sd %s %.2f%% %s %.2f%%",
+                     days, rate_type, current_rate, condition, target_rate)
+            notifier.queue_alert(
                 days=days,
                 alert_type=rate_type,
                 current_rate=current_rate,
@@ -145,11 +200,83 @@ def run_price_check():
             )
             alerts_triggered += 1
         else:
-            print(f"No alert: {days}d {rate_type} {current_rate:.2f}% (target: {condition} {target_rate:.2f}%)")
+            log.debug("No alert: %sd %s %.2f%% (target: %s %.2f%%)",
+                      days, rate_type, current_rate, condition, target_rate)
+
+    return alerts_triggered
+
+
+async def run_price_check_async():
+    """Async entry point: one event loop owns IOL fetches and Telegram sends."""
+    # Load credentials from environment variables
+    iol_username = os.environ.get("IOL_USERNAME")
+    iol_password = os.environ.get("IOL_PASSWORD")
+    telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
+    telegram_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
 
-    print(f"Price check complete. {alerts_triggered} alert(s) triggered.")
+    # Validate required environment variables
+    if not all([iol_username, iol_password, telegram_token, telegram_chat_id]):
+        log.error("Missing required environment variables; required: "
+                  "IOL_USERNAME, IOL_PASSWORD, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID")
+        return False
+
+    # Initialize clients
+    iol_client = IOLClient(iol_username, iol_password)
+
+    try:
+        async with AsyncTelegramNotifier(telegram_token, telegram_chat_id) as notifier:
+            # Load alerts configuration
+            try:
+                config = load_alerts_config()
+            except FileNotFoundError:
+                await notifier.send_error_message("alerts_config.json not found")
+                return False
+            except json.JSONDecodeError as e:
+                await notifier.send_error_message(f"Invalid JSON in config: {e}")
+                return False
+
+            # Resolve fields and comparators once; the check loop unpacks tuples
+            alerts = parse_alerts(config.get("alerts", []))
+
+            if not alerts:
+                log.info("No alerts configured")
+                return True
+
+            # The blocking client runs in a worker thread so this loop stays
+            # free for Telegram traffic
+            cauciones = await asyncio.to_thread(iol_client.get_cauciones)
+
+            if not cauciones:
+                await notifier.send_error_message("Failed to fetch cauciones data from IOL API")
+                return False
+
+            # Build a lookup by days (plazo) - handle different field names
+            cauciones_by_days = {
+                days_key: c
+                for c in cauciones
+                if (days_key := c.get("plazo") or c.get("diasVencimiento") or c.get("cantidadDias"))
+            }
+
+            if not cauciones_by_days:
+                log.warning("Could not parse cauciones data. Raw data sample: %r",
+                            cauciones[:2] if len(cauciones) > 2 else cauciones)
+
+            # Check each enabled alert against the single fetched snapshot
+            alerts_triggered = check_alerts(alerts, cauciones_by_days, notifier)
+            await notifier.flush()
+    finally:
+        # close() drives the worker-thread event loop, so it must run off
+        # this one
+        await asyncio.to_thread(iol_client.close)
+
+    log.info("Price check complete. %d alert(s) triggered.", alerts_triggered)
     return True
 
 
+def run_price_check():
+    """Run the price check on a fresh event loop (sync convenience wrapper)."""
+    return asyncio.run(run_price_check_async())
+
+
 if __name__ == "__main__":
     run_price_check()
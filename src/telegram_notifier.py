@@ -1,36 +1,75 @@
 """Telegram notification handler for price alerts."""
 
+import asyncio
+import logging
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
+log = logging.getLogger(__name__)
+
+# Alert template built once at import; format fills the per-alert fields
+# without re-concatenating the constant labels on every send
+_ALERT_TPL = (
+    "🔔 <b>Caucion Price Alert!</b>\n\n"
+    "📊 <b>Plazo:</b> {days} day(s)\n"
+    "📈 <b>Type:</b> {type_label}\n"
+    "💰 <b>Current Rate:</b> {current_rate:.2f}%\n"
+    "🎯 <b>Target Rate:</b> {target_rate:.2f}%\n"
+    "📌 <b>Condition:</b> {condition} {condition_text}\n"
+)
+_ALERT_DESCRIPTION_TPL = "\n📝 <i>{description}</i>"
+
 
 class TelegramNotifier:
     """Send notifications via Telegram Bot API."""
 
     BASE_URL = "https://api.telegram.org/bot"
 
+    # Telegram rejects messages longer than this
+    MAX_MESSAGE_LEN = 4096
+
+    # Divider between alerts batched into one message
+    SEPARATOR = "\n\n━━━\n\n"
+
+    # Static messages composed once instead of per call
+    STARTUP_MESSAGE = "✅ <b>Cauciones Price Checker Started</b>\n\nMonitoring prices..."
+    ERROR_PREFIX = "❌ <b>Error in Price Checker</b>\n\n"
+
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
+        self._pending: list = []
+
+        # One pooled session keeps the TLS connection to api.telegram.org
+        # alive across the messages sent in a single run
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self._url = f"{self.BASE_URL}{bot_token}/sendMessage"
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
 
     def send_message(self, message: str) -> bool:
         """Send a text message to the configured chat."""
-        url = f"{self.BASE_URL}{self.bot_token}/sendMessage"
         payload = {
             "chat_id": self.chat_id,
             "text": message,
             "parse_mode": "HTML"
         }
 
-        response = requests.post(url, json=payload)
+        response = self._session.post(self._url, json=payload, timeout=10)
 
         if response.status_code == 200:
             return True
 
-        print(f"Failed to send Telegram message: {response.status_code} - {response.text}")
+        self._log_send_failure(response)
         return False
 
-    def send_price_alert(
+    def _format_alert(
         self,
         days: int,
         alert_type: str,
@@ -38,31 +77,141 @@ class TelegramNotifier:
         target_rate: float,
         condition: str,
         description: Optional[str] = None
-    ) -> bool:
-        """Send a formatted price alert message."""
-        type_label = "Colocador (Lender)" if alert_type == "colocador" else "Tomador (Borrower)"
-        condition_text = "reached" if condition in (">=", "==") else "dropped to"
-
-        message = (
-            f"🔔 <b>Caucion Price Alert!</b>\n\n"
-            f"📊 <b>Plazo:</b> {days} day(s)\n"
-            f"📈 <b>Type:</b> {type_label}\n"
-            f"💰 <b>Current Rate:</b> {current_rate:.2f}%\n"
-            f"🎯 <b>Target Rate:</b> {target_rate:.2f}%\n"
-            f"📌 <b>Condition:</b> {condition} {condition_text}\n"
+    ) -> str:
+        """Build the HTML block for one price alert."""
+        message = _ALERT_TPL.format(
+            days=days,
+            type_label="Colocador (Lender)" if alert_type == "colocador" else "Tomador (Borrower)",
+            current_rate=current_rate,
+            target_rate=target_rate,
+            condition=condition,
+            condition_text="reached" if condition in (">=", "==") else "dropped to",
         )
 
         if description:
-            message += f"\n📝 <i>{description}</i>"
+            message += _ALERT_DESCRIPTION_TPL.format(description=description)
+
+        return message
+
+    def send_price_alert(self, **kwargs) -> bool:
+        """Send a formatted price alert message immediately."""
+        return self.send_message(self._format_alert(**kwargs))
+
+    def queue_alert(self, **kwargs) -> None:
+        """Queue a price alert for a single batched send via flush()."""
+        self._pending.append(self._format_alert(**kwargs))
+
+    def _batched_messages(self) -> list:
+        """Join queued alerts into messages that fit under the size limit."""
+        messages = []
+        chunk: list = []
+        length = 0
+        for block in self._pending:
+            extra = len(block) + (len(self.SEPARATOR) if chunk else 0)
+            if chunk and length + extra > self.MAX_MESSAGE_LEN:
+                messages.append(self.SEPARATOR.join(chunk))
+                chunk, length = [], 0
+                extra = len(block)
+            chunk.append(block)
+            length += extra
 
-        return self.send_message(message)
+        if chunk:
+            messages.append(self.SEPARATOR.join(chunk))
+        return messages
+
+    def flush(self) -> bool:
+        """Send all queued alerts as one message, chunked at the size limit."""
+        if not self._pending:
+            return True
+
+        ok = True
+        for message in self._batched_messages():
+            ok = self.send_message(message) and ok
+
+        self._pending.clear()
+        return ok
+
+    def _log_send_failure(self, response) -> None:
+        log.error("Failed to send Telegram message: %s - %s",
+                  response.status_code, response.text)
 
     def send_startup_message(self) -> bool:
         """Send a message indicating the price checker has started."""
-        message = "✅ <b>Cauciones Price Checker Started</b>\n\nMonitoring prices..."
-        return self.send_message(message)
+        return self.send_message(self.STARTUP_MESSAGE)
 
     def send_error_message(self, error: str) -> bool:
         """Send an error notification."""
-        message = f"❌ <b>Error in Price Checker</b>\n\n{error}"
-        return self.send_message(message)
+        return self.send_message(self.ERROR_PREFIX + error)
+
+
+class AsyncTelegramNotifier(TelegramNotifier):
+    """Async variant that sends messages concurrently over one pooled client."""
+
+    def __init__(self, bot_token: str, chat_id: str):
+        super().__init__(bot_token, chat_id)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared AsyncClient, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=10),
+                timeout=10.0,
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the async client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def send_message(self, message: str) -> bool:
+        """Send a text message to the configured chat."""
+        payload = {
+            "chat_id": self.chat_id,
+            "text": message,
+            "parse_mode": "HTML"
+        }
+
+        try:
+            response = await self._get_client().post(self._url, json=payload)
+        except httpx.HTTPError as e:
+            log.error("Failed to send Telegram message: %s", e)
+            return False
+
+        if response.status_code == 200:
+            return True
+
+        self._log_send_failure(response)
+        return False
+
+    async def send_price_alert(self, **kwargs) -> bool:
+        """Send a formatted price alert message immediately."""
+        return await self.send_message(self._format_alert(**kwargs))
+
+    async def send_startup_message(self) -> bool:
+        """Send a message indicating the price checker has started."""
+        return await self.send_message(self.STARTUP_MESSAGE)
+
+    async def send_error_message(self, error: str) -> bool:
+        """Send an error notification."""
+        return await self.send_message(self.ERROR_PREFIX + error)
+
+    async def flush(self) -> bool:
+        """Send all queued alerts concurrently, chunked at the size limit."""
+        if not self._pending:
+            return True
+
+        results = await asyncio.gather(
+            *(self.send_message(message) for message in self._batched_messages())
+        )
+        self._pending.clear()
+        return all(results)